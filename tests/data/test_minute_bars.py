@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from datetime import timedelta
+from multiprocessing.pool import ThreadPool
 import os
 
 from numpy import (
@@ -20,6 +21,7 @@ from numpy import (
     array,
     int64,
     float64,
+    isnan,
     full,
     nan,
     transpose,
@@ -42,6 +44,7 @@ from zipline.data.minute_bars import (
     BcolzMinuteBarReader,
     BcolzMinuteOverlappingData,
     US_EQUITIES_MINUTES_PER_DAY,
+    WRITE_CHUNK_SESSIONS,
     BcolzMinuteWriterColumnMismatch,
     H5MinuteBarUpdateWriter,
     H5MinuteBarUpdateReader,
@@ -601,6 +604,37 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
 
         self.assertEquals(200.0, volume_price)
 
+    def test_write_multiple_sids_with_pool(self):
+        minute = self.market_opens[TEST_CALENDAR_START]
+        sids = [1, 2, 3]
+        data = [
+            (sid, DataFrame(
+                data={
+                    'open': [10.0 * sid],
+                    'high': [12.0 * sid],
+                    'low': [9.0 * sid],
+                    'close': [11.0 * sid],
+                    'volume': [100.0 * sid],
+                },
+                index=[minute]))
+            for sid in sids
+        ]
+
+        pool = ThreadPool(len(sids))
+        try:
+            self.writer.write(data, pool=pool)
+        finally:
+            pool.close()
+            pool.join()
+
+        for sid in sids:
+            self.assertEqual(
+                self.reader.get_value(sid, minute, 'close'), 11.0 * sid,
+            )
+            self.assertEqual(
+                self.reader.get_value(sid, minute, 'volume'), 100.0 * sid,
+            )
+
     def test_pad_data(self):
         """
         Test writing empty data.
@@ -740,6 +774,33 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
             else:
                 assert_array_equal(zeros(9), ohlcv_window[i][0])
 
+    def test_values_too_large_for_uint32(self):
+        """
+        Test that rows with prices which do not fit into a uint32 after
+        scaling are zeroed out, while the remaining rows are kept.
+        """
+        sid = 1
+        minute = self.market_opens[self.test_calendar_start]
+        minutes = date_range(minute, periods=2, freq='min')
+        data = DataFrame(
+            data={
+                'open': [10.0, 11.0],
+                'high': [20.0, 1e7],
+                'low': [30.0, 31.0],
+                'close': [40.0, 41.0],
+                'volume': [50.0, 51.0],
+            },
+            index=minutes)
+        self.writer.write_sid(sid, data, invalid_data_behavior='ignore')
+
+        self.assertEqual(self.reader.get_value(sid, minutes[0], 'high'), 20.0)
+        self.assertEqual(self.reader.get_value(sid, minutes[0], 'volume'), 50)
+        for field in 'open', 'high', 'low', 'close':
+            self.assertTrue(
+                isnan(self.reader.get_value(sid, minutes[1], field))
+            )
+        self.assertEqual(self.reader.get_value(sid, minutes[1], 'volume'), 0)
+
     def test_write_cols(self):
         minute_0 = self.market_opens[self.test_calendar_start]
         minute_1 = minute_0 + timedelta(minutes=1)
@@ -808,6 +869,112 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
         with self.assertRaises(BcolzMinuteWriterColumnMismatch):
             self.writer.write_cols(sid, dts, cols)
 
+    def test_write_spanning_multiple_chunks(self):
+        """
+        Test writing data which spans more sessions than are built in memory
+        at once.
+        """
+        sessions = self.market_opens.index
+        self.assertGreater(len(sessions), WRITE_CHUNK_SESSIONS + 10)
+        minutes = DatetimeIndex([
+            self.market_opens[sessions[0]],
+            self.market_opens[sessions[WRITE_CHUNK_SESSIONS - 1]] +
+            Timedelta(minutes=US_EQUITIES_MINUTES_PER_DAY - 1),
+            self.market_opens[sessions[WRITE_CHUNK_SESSIONS]],
+            self.market_opens[sessions[WRITE_CHUNK_SESSIONS + 10]] +
+            Timedelta(minutes=5),
+        ])
+        sid = 1
+        data = DataFrame(
+            data={
+                'open': [10.0, 11.0, 12.0, 13.0],
+                'high': [20.0, 21.0, 22.0, 23.0],
+                'low': [30.0, 31.0, 32.0, 33.0],
+                'close': [40.0, 41.0, 42.0, 43.0],
+                'volume': [50.0, 51.0, 52.0, 53.0],
+            },
+            index=minutes)
+        self.writer.write_sid(sid, data)
+
+        self.assertEqual(
+            self.reader.table_len(sid),
+            (WRITE_CHUNK_SESSIONS + 10) * US_EQUITIES_MINUTES_PER_DAY + 6,
+        )
+        for minute, row in data.iterrows():
+            for field in 'open', 'high', 'low', 'close', 'volume':
+                self.assertEqual(
+                    self.reader.get_value(sid, minute, field),
+                    row[field],
+                )
+        self.assertEqual(
+            self.reader.get_value(sid, minutes[0] + Timedelta('1 min'),
+                                  'volume'),
+            0,
+        )
+
+    def test_write_cols_unsorted(self):
+        minutes = date_range(self.market_opens[self.test_calendar_start],
+                             periods=3, freq='min')
+        dts = minutes[[0, 2, 1]].values
+        sid = 1
+        cols = {
+            'open': array([10.0, 11.0, 12.0]),
+            'high': array([20.0, 21.0, 22.0]),
+            'low': array([30.0, 31.0, 32.0]),
+            'close': array([40.0, 41.0, 42.0]),
+            'volume': array([50.0, 51.0, 52.0])
+        }
+        with self.assertRaises(ValueError):
+            self.writer.write_cols(sid, dts, cols)
+
+    def test_no_overwrite_of_earlier_minutes(self):
+        minutes = date_range(self.market_opens[self.test_calendar_start],
+                             periods=3, freq='min')
+        sid = 1
+        data = DataFrame(
+            data={
+                'open': [10.0, 11.0],
+                'high': [20.0, 21.0],
+                'low': [30.0, 31.0],
+                'close': [40.0, 41.0],
+                'volume': [50.0, 51.0]
+            },
+            index=minutes[1:])
+        self.writer.write_sid(sid, data)
+
+        # The last minute is after the data already written, but the first
+        # minute is not.
+        overlapping = data.copy()
+        overlapping.index = [minutes[2], minutes[2] + Timedelta('1 min')]
+        with self.assertRaises(BcolzMinuteOverlappingData):
+            self.writer.write_sid(sid, overlapping)
+
+    def test_write_csvs(self):
+        minute_0 = self.market_opens[self.test_calendar_start]
+        minute_1 = minute_0 + timedelta(minutes=1)
+        sid = 1
+        data = DataFrame(
+            data={
+                'open': [10.0, 11.0],
+                'high': [20.0, 21.0],
+                'low': [30.0, 31.0],
+                'close': [40.0, 41.0],
+                'volume': [50, 51],
+            },
+            index=DatetimeIndex([minute_0, minute_1], tz='UTC'),
+        )
+        path = self.instance_tmpdir.getpath('{}.csv'.format(sid))
+        data.to_csv(path, index_label='minute')
+
+        self.writer.write_csvs({sid: path})
+
+        for minute, row in data.iterrows():
+            for field in 'open', 'high', 'low', 'close', 'volume':
+                self.assertEqual(
+                    self.reader.get_value(sid, minute, field),
+                    row[field],
+                )
+
     def test_unadjusted_minutes(self):
         """
         Test unadjusted minutes.
@@ -960,6 +1127,28 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
                 'open'
             )
 
+    def test_find_positions_of_minutes(self):
+        # 2014-07-03 is an early close.
+        minutes = self.trading_calendar.minutes_for_sessions_in_range(
+            Timestamp('2014-07-02', tz='UTC'),
+            Timestamp('2014-07-07', tz='UTC'),
+        )
+        # Include minutes after the early close, which are adjusted back to
+        # the close.
+        minutes = minutes.union(
+            date_range('2014-07-03 17:01', periods=5, freq='min', tz='UTC')
+        )
+
+        assert_array_equal(
+            self.reader._find_positions_of_minutes(minutes),
+            [self.reader._find_position_of_minute(dt) for dt in minutes],
+        )
+
+        with self.assertRaises(ValueError):
+            self.reader._find_positions_of_minutes(
+                [Timestamp('2015-06-02 20:01:00', tz='UTC')],
+            )
+
     def test_adjust_non_trading_minutes_half_days(self):
         # half day
         start_day = Timestamp('2015-11-27', tz='UTC')
@@ -1,5 +1,5 @@
 from numpy cimport ndarray, long_t
-from numpy import searchsorted
+from numpy import empty, int_, searchsorted
 from cpython cimport bool
 cimport cython
 
@@ -88,6 +88,54 @@ def find_position_of_minute(ndarray[long_t, ndim=1] market_opens,
 
     return (market_open_loc * minutes_per_day) + delta
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def find_positions_of_sorted_minutes(ndarray[long_t, ndim=1] market_opens,
+                                     ndarray[long_t, ndim=1] minute_vals,
+                                     short minutes_per_day):
+    """
+    Finds the positions of the given minutes in the given array of market
+    opens.
+
+    Both arrays must be sorted, which allows them to be walked together in a
+    single pass, rather than searching the market opens for each minute.
+
+    Parameters
+    ----------
+    market_opens: numpy array of ints
+        Market opens, in minute epoch values.
+
+    minute_vals: numpy array of ints
+        The desired minutes, as minute epochs, in increasing order. Each
+        minute must be on or after the first market open.
+
+    minutes_per_day: int
+        The number of minutes per day (e.g. 390 for NYSE).
+
+    Returns
+    -------
+    numpy array of ints: The position of each of the given minutes in the
+    market opens array.
+    """
+    cdef Py_ssize_t i, market_open_loc = 0
+    cdef Py_ssize_t num_market_opens = len(market_opens)
+    cdef Py_ssize_t num_minutes = len(minute_vals)
+    cdef long_t minute_val
+    cdef ndarray[long_t, ndim=1] positions = empty(num_minutes, dtype=int_)
+
+    for i in range(num_minutes):
+        minute_val = minute_vals[i]
+        while (market_open_loc + 1 < num_market_opens and
+               market_opens[market_open_loc + 1] <= minute_val):
+            market_open_loc += 1
+
+        positions[i] = (
+            market_open_loc * minutes_per_day +
+            minute_val - market_opens[market_open_loc]
+        )
+
+    return positions
+
 def find_last_traded_position_internal(
         ndarray[long_t, ndim=1] market_opens,
         ndarray[long_t, ndim=1] market_closes,
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABCMeta, abstractmethod
+from functools import partial
 import json
 import os
 from glob import glob
@@ -35,6 +36,7 @@ from trading_calendars import get_calendar
 from zipline.data._minute_bar_internal import (
     minute_value,
     find_position_of_minute,
+    find_positions_of_sorted_minutes,
     find_last_traded_position_internal
 )
 
@@ -44,6 +46,8 @@ from zipline.data.bcolz_daily_bars import check_uint32_safe
 from zipline.utils.cli import maybe_show_progress
 from zipline.utils.compat import mappingproxy
 from zipline.utils.memoize import lazyval
+from zipline.utils.paths import ensure_directory_containing
+from zipline.utils.pool import SequentialPool
 
 
 logger = logbook.Logger('MinuteBars')
@@ -53,6 +57,10 @@ FUTURES_MINUTES_PER_DAY = 1440
 
 DEFAULT_EXPECTEDLEN = US_EQUITIES_MINUTES_PER_DAY * 252 * 15
 
+# The number of sessions worth of minutes which are built in memory at a time
+# when appending to a sid's ctable.
+WRITE_CHUNK_SESSIONS = 252
+
 OHLC_RATIO = 1000
 
 
@@ -71,15 +79,11 @@ class MinuteBarReader(BarReader):
 
 
 def _calc_minute_index(market_opens, minutes_per_day):
-    minutes = np.zeros(len(market_opens) * minutes_per_day,
-                       dtype='datetime64[ns]')
+    # Broadcast each market open against the minute offsets of a day, giving
+    # a (sessions, minutes_per_day) block which flattens into the index.
     deltas = np.arange(0, minutes_per_day, dtype='timedelta64[m]')
-    for i, market_open in enumerate(market_opens):
-        start = market_open.asm8
-        minute_values = start + deltas
-        start_ix = minutes_per_day * i
-        end_ix = start_ix + minutes_per_day
-        minutes[start_ix:end_ix] = minute_values
+    starts = market_opens.values.astype('datetime64[ns]')
+    minutes = (starts[:, np.newaxis] + deltas[np.newaxis, :]).ravel()
     return pd.to_datetime(minutes, utc=True, box=True)
 
 
@@ -132,19 +136,21 @@ def convert_cols(cols, scale_factor, sid, invalid_data_behavior):
         If 'warn', logs a warning and filters out incompatible values.
         If 'ignore', silently filters out incompatible values.
     """
-    scaled_opens = (np.nan_to_num(cols['open']) * scale_factor).round()
-    scaled_highs = (np.nan_to_num(cols['high']) * scale_factor).round()
-    scaled_lows = (np.nan_to_num(cols['low']) * scale_factor).round()
-    scaled_closes = (np.nan_to_num(cols['close']) * scale_factor).round()
-
-    exclude_mask = np.zeros_like(scaled_opens, dtype=bool)
-
-    for col_name, scaled_col in [
-        ('open', scaled_opens),
-        ('high', scaled_highs),
-        ('low', scaled_lows),
-        ('close', scaled_closes),
-    ]:
+    # Scale all four price columns at once as a single (4, N) block rather
+    # than making a separate pass over each column.
+    scaled_ohlc = np.nan_to_num(np.array(
+        [cols['open'], cols['high'], cols['low'], cols['close']],
+        dtype=np.float64,
+    ))
+    scaled_ohlc *= scale_factor
+    scaled_ohlc.round(out=scaled_ohlc)
+
+    exclude_mask = np.zeros(scaled_ohlc.shape[1], dtype=bool)
+
+    for scaled_col, col_name in zip(
+        scaled_ohlc,
+        ('open', 'high', 'low', 'close'),
+    ):
         max_val = scaled_col.max()
 
         try:
@@ -162,13 +168,10 @@ def convert_cols(cols, scale_factor, sid, invalid_data_behavior):
 
             # We want to exclude all rows that have an unsafe value in
             # this column.
-            exclude_mask &= (scaled_col >= np.iinfo(np.uint32).max)
+            exclude_mask |= (scaled_col >= np.iinfo(np.uint32).max)
 
     # Convert all cols to uint32.
-    opens = scaled_opens.astype(np.uint32)
-    highs = scaled_highs.astype(np.uint32)
-    lows = scaled_lows.astype(np.uint32)
-    closes = scaled_closes.astype(np.uint32)
+    opens, highs, lows, closes = scaled_ohlc.astype(np.uint32)
     volumes = cols['volume'].astype(np.uint32)
 
     # Exclude rows with unsafe values by setting to zero.
@@ -432,14 +435,24 @@ class BcolzMinuteBarWriter(object):
     corresponding position of the enumeration of the aforementioned datetime
     index.
 
-    The datetimes which correspond to each position are written in the metadata
-    as integer nanoseconds since the epoch into the `minute_index` key.
+    No datetime column is stored. The datetime which corresponds to each
+    position is implied by the layout: position ``i`` is minute
+    ``i % minutes_per_day`` after the market open of session
+    ``i // minutes_per_day``, where the sessions are those of the calendar
+    between the ``start_session`` and ``end_session`` in the metadata.
 
     See Also
     --------
     zipline.data.minute_bars.BcolzMinuteBarReader
     """
     COL_NAMES = ('open', 'high', 'low', 'close', 'volume')
+    _csv_dtypes = {
+        'open': np.float64,
+        'high': np.float64,
+        'low': np.float64,
+        'close': np.float64,
+        'volume': np.float64,
+    }
 
     def __init__(self,
                  rootdir,
@@ -467,6 +480,8 @@ class BcolzMinuteBarWriter(object):
 
         self._minute_index = _calc_minute_index(
             self._schedule.market_open, self._minutes_per_day)
+        self._market_open_values = self._schedule.market_open.values.\
+            astype('datetime64[m]').astype(np.int64)
 
         if write_metadata:
             metadata = BcolzMinuteBarMetadata(
@@ -570,10 +585,9 @@ class BcolzMinuteBarWriter(object):
         # Only create the containing subdir on creation.
         # This is not to be confused with the `.bcolz` directory, but is the
         # directory up one level from the `.bcolz` directories.
-        sid_containing_dirname = os.path.dirname(path)
-        if not os.path.exists(sid_containing_dirname):
-            # Other sids may have already created the containing directory.
-            os.makedirs(sid_containing_dirname)
+        # Other sids may have already created the containing directory,
+        # possibly concurrently when writing with a pool.
+        ensure_directory_containing(path)
         initial_array = np.empty(0, np.uint32)
         table = ctable(
             rootdir=path,
@@ -666,7 +680,11 @@ class BcolzMinuteBarWriter(object):
         for k, v in kwargs.items():
             table.attrs[k] = v
 
-    def write(self, data, show_progress=False, invalid_data_behavior='warn'):
+    def write(self,
+              data,
+              show_progress=False,
+              invalid_data_behavior='warn',
+              pool=SequentialPool()):
         """Write a stream of minute data.
 
         Parameters
@@ -685,6 +703,17 @@ class BcolzMinuteBarWriter(object):
             the dates must be strictly increasing.
         show_progress : bool, optional
             Whether or not to show a progress bar while writing.
+        pool : Pool, optional
+            The pool to use to write sids concurrently. This object must
+            support ``imap_unordered``. Each sid is written to its own bcolz
+            directory, so sids can be written independently; however, when
+            using a concurrent pool a given sid may only appear once in
+            ``data``. Defaults to writing each sid sequentially.
+
+        See Also
+        --------
+        :class:`zipline.utils.pool.SequentialPool`
+        :class:`multiprocessing.Pool`
         """
         ctx = maybe_show_progress(
             data,
@@ -692,10 +721,72 @@ class BcolzMinuteBarWriter(object):
             item_show_func=lambda e: e if e is None else str(e[0]),
             label="Merging minute equity files:",
         )
-        write_sid = self.write_sid
+        write_sid = partial(self._write_sid_item, invalid_data_behavior)
+        with ctx as it:
+            for _ in pool.imap_unordered(write_sid, it):
+                pass
+
+    def _write_sid_item(self, invalid_data_behavior, item):
+        sid, df = item
+        self.write_sid(sid, df, invalid_data_behavior=invalid_data_behavior)
+
+    def write_csvs(self,
+                   asset_map,
+                   show_progress=False,
+                   invalid_data_behavior='warn',
+                   pool=SequentialPool()):
+        """Read CSVs of minute data and write them.
+
+        Parameters
+        ----------
+        asset_map : dict[int -> str]
+            A mapping from asset id to file path with the CSV data for that
+            asset. Each file should have a ``minute`` column of UTC market
+            minutes, in increasing order, along with the ``open``, ``high``,
+            ``low``, ``close`` and ``volume`` columns.
+        show_progress : bool, optional
+            Whether or not to show a progress bar while writing.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}, optional
+            What to do when data is encountered that is outside the range of
+            a uint32.
+        pool : Pool, optional
+            The pool to use to read and write sids concurrently. Each CSV is
+            parsed by the same task which writes it, so parsing is also spread
+            across the pool. Defaults to reading and writing each sid
+            sequentially.
+        """
+        ctx = maybe_show_progress(
+            list(asset_map.items()),
+            show_progress=show_progress,
+            item_show_func=lambda e: e if e is None else str(e[0]),
+            label="Merging minute equity files:",
+        )
+        write_csv = partial(self._write_csv_item, invalid_data_behavior)
         with ctx as it:
-            for e in it:
-                write_sid(*e, invalid_data_behavior=invalid_data_behavior)
+            for _ in pool.imap_unordered(write_csv, it):
+                pass
+
+    def _write_csv_item(self, invalid_data_behavior, item):
+        sid, path = item
+        df = pd.read_csv(
+            path,
+            engine='c',
+            memory_map=True,
+            low_memory=False,
+            dtype=self._csv_dtypes,
+        )
+        # Hand the parsed columns straight to the column writer rather than
+        # building a DatetimeIndex only to unpack it again in `write_sid`.
+        cols = {name: df[name].values for name in self.COL_NAMES}
+        # Every row shares the same timestamp format, so convert the whole
+        # column at once from the format of its first value, rather than
+        # leaving `read_csv` to parse the dates.
+        dts = pd.to_datetime(
+            df['minute'].values,
+            utc=True,
+            infer_datetime_format=True,
+        ).values
+        self._write_cols(sid, dts, cols, invalid_data_behavior)
 
     def write_sid(self, sid, df, invalid_data_behavior='warn'):
         """
@@ -781,67 +872,85 @@ class BcolzMinuteBarWriter(object):
         """
         table = self._ensure_ctable(sid)
 
-        tds = self._session_labels
-        input_first_day = self._calendar.minute_to_session_label(
-            pd.Timestamp(dts[0]), direction='previous')
-
-        last_date = self.last_date_in_output_for_sid(sid)
-
-        day_before_input = input_first_day - tds.freq
-
-        self.pad(sid, day_before_input)
-        table = self._ensure_ctable(sid)
+        minute_vals = dts.astype('datetime64[m]').astype(np.int64)
+        # The positions below are found by walking the market opens alongside
+        # the input minutes, which is only valid if they are sorted.
+        if (np.diff(minute_vals) <= 0).any():
+            raise ValueError(
+                "dts for sid={0} must be strictly increasing".format(sid)
+            )
 
-        # Get the number of minutes already recorded in this sid's ctable
+        # Get the number of minutes already recorded in this sid's ctable.
+        # Any minutes between these and the first input minute are left as
+        # gaps in the window below and zero filled, which pads the ctable in
+        # the same append as the new data.
         num_rec_mins = table.size
 
-        all_minutes = self._minute_index
         # Get the latest minute we wish to write to the ctable
         last_minute_to_write = pd.Timestamp(dts[-1], tz='UTC')
+        latest_min_count = self._minute_index.get_loc(last_minute_to_write)
+
+        # Each session occupies a block of `minutes_per_day` positions which
+        # starts at its market open, so the position of a minute is the start
+        # of its session's block plus the minutes elapsed since that open.
+        # Since `dts` are increasing, the positions are found by walking the
+        # market opens alongside them in a single pass.
+        positions = find_positions_of_sorted_minutes(
+            self._market_open_values,
+            minute_vals,
+            self._minutes_per_day,
+        )
 
         # In the event that we've already written some minutely data to the
         # ctable, guard against overwriting that data.
-        if num_rec_mins > 0:
-            last_recorded_minute = all_minutes[num_rec_mins - 1]
-            if last_minute_to_write <= last_recorded_minute:
-                raise BcolzMinuteOverlappingData(dedent("""
-                Data with last_date={0} already includes input start={1} for
-                sid={2}""".strip()).format(last_date, input_first_day, sid))
-
-        latest_min_count = all_minutes.get_loc(last_minute_to_write)
-
-        # Get all the minutes we wish to write (all market minutes after the
-        # latest currently written, up to and including last_minute_to_write)
-        all_minutes_in_window = all_minutes[num_rec_mins:latest_min_count + 1]
-
-        minutes_count = all_minutes_in_window.size
-
-        open_col = np.zeros(minutes_count, dtype=np.uint32)
-        high_col = np.zeros(minutes_count, dtype=np.uint32)
-        low_col = np.zeros(minutes_count, dtype=np.uint32)
-        close_col = np.zeros(minutes_count, dtype=np.uint32)
-        vol_col = np.zeros(minutes_count, dtype=np.uint32)
-
-        dt_ixs = np.searchsorted(all_minutes_in_window.values,
-                                 dts.astype('datetime64[ns]'))
+        if positions[0] < num_rec_mins:
+            # These are only needed for the error message, so only look
+            # them up once we know we are raising.
+            last_date = self.last_date_in_output_for_sid(sid)
+            input_first_day = self._calendar.minute_to_session_label(
+                pd.Timestamp(dts[0]), direction='previous')
+            raise BcolzMinuteOverlappingData(dedent("""
+            Data with last_date={0} already includes input start={1} for
+            sid={2}""".strip()).format(last_date, input_first_day, sid))
+
+        # Get the number of minutes we wish to write (all market minutes after
+        # the latest currently written, up to and including
+        # last_minute_to_write)
+        minutes_count = latest_min_count + 1 - num_rec_mins
+        dt_ixs = positions - num_rec_mins
 
         ohlc_ratio = self.ohlc_ratio_for_sid(sid)
-
-        (
-            open_col[dt_ixs],
-            high_col[dt_ixs],
-            low_col[dt_ixs],
-            close_col[dt_ixs],
-            vol_col[dt_ixs],
-        ) = convert_cols(cols, ohlc_ratio, sid, invalid_data_behavior)
-
-        table.append([
-            open_col,
-            high_col,
-            low_col,
-            close_col,
-            vol_col
-        ])
+        converted = convert_cols(cols, ohlc_ratio, sid, invalid_data_behavior)
+
+        # Build and append the window a bounded number of sessions at a time,
+        # so that padding or writing a long history does not hold every
+        # minute of it in memory at once. All of the OHLCV columns share a
+        # single block, one row per column, which is reused for each chunk.
+        chunk_len = WRITE_CHUNK_SESSIONS * self._minutes_per_day
+        buf = np.empty(
+            (len(self.COL_NAMES), min(chunk_len, minutes_count)),
+            dtype=np.uint32,
+        )
+        for chunk_start in range(0, minutes_count, chunk_len):
+            chunk_end = min(chunk_start + chunk_len, minutes_count)
+            columns = buf[:, :chunk_end - chunk_start]
+
+            # `dt_ixs` is sorted, so the input rows in this chunk are a
+            # contiguous slice.
+            lo, hi = np.searchsorted(dt_ixs, [chunk_start, chunk_end])
+            chunk_ixs = dt_ixs[lo:hi] - chunk_start
+
+            # Only the minutes with no input data need to be zeroed, since
+            # every other position is overwritten below.
+            gaps = np.ones(chunk_end - chunk_start, dtype=bool)
+            gaps[chunk_ixs] = False
+            if gaps.any():
+                columns[:, gaps] = 0
+
+            for column, values in zip(columns, converted):
+                column[chunk_ixs] = values[lo:hi]
+
+            table.append(list(columns))
         table.flush()
 
     def data_len_for_day(self, day):
@@ -1032,17 +1141,22 @@ class BcolzMinuteBarReader(MinuteBarReader):
         because of early closes.
         """
         itree = IntervalTree()
-        for market_open, early_close in self._minutes_to_exclude():
-            start_pos = self._find_position_of_minute(early_close) + 1
-            end_pos = (
-                self._find_position_of_minute(market_open)
-                +
-                self._minutes_per_day
-                -
-                1
-            )
-            data = (start_pos, end_pos)
-            itree[start_pos:end_pos + 1] = data
+        minutes_to_exclude = self._minutes_to_exclude()
+        if not minutes_to_exclude:
+            return itree
+
+        market_opens, early_closes = zip(*minutes_to_exclude)
+        start_positions = self._find_positions_of_minutes(early_closes) + 1
+        end_positions = (
+            self._find_positions_of_minutes(market_opens)
+            +
+            self._minutes_per_day
+            -
+            1
+        )
+        for start_pos, end_pos in zip(start_positions, end_positions):
+            data = (int(start_pos), int(end_pos))
+            itree[data[0]:data[1] + 1] = data
         return itree
 
     def _exclusion_indices_for_range(self, start_idx, end_idx):
@@ -1157,8 +1271,8 @@ class BcolzMinuteBarReader(MinuteBarReader):
 
     def _find_last_traded_position(self, asset, dt):
         volumes = self._open_minute_file('volume', asset)
-        start_date_minute = asset.start_date.value / NANOS_IN_MINUTE
-        dt_minute = dt.value / NANOS_IN_MINUTE
+        start_date_minute = asset.start_date.value // NANOS_IN_MINUTE
+        dt_minute = dt.value // NANOS_IN_MINUTE
 
         try:
             # if we know of a dt before which this asset has no volume,
@@ -1223,11 +1337,50 @@ class BcolzMinuteBarReader(MinuteBarReader):
         return find_position_of_minute(
             self._market_open_values,
             self._market_close_values,
-            minute_dt.value / NANOS_IN_MINUTE,
+            minute_dt.value // NANOS_IN_MINUTE,
             self._minutes_per_day,
             False,
         )
 
+    def _find_positions_of_minutes(self, minute_dts):
+        """
+        Internal method that returns the positions of the given minutes in the
+        list of every trading minute since market open of the first trading
+        day. Adjusts non market minutes to the last close.
+
+        This is a vectorized version of `_find_position_of_minute` for use
+        when looking up many minutes at once.
+
+        Parameters
+        ----------
+        minute_dts: pd.DatetimeIndex or iterable of pd.Timestamp
+            The minutes whose positions should be calculated.
+
+        Returns
+        -------
+        np.ndarray[int64]: The positions of the given minutes in the list of
+        all trading minutes since market open on the first trading day.
+
+        Raises
+        ------
+        ValueError
+            If any of the given minutes is not between an open and a close.
+        """
+        minute_vals = pd.DatetimeIndex(minute_dts).asi8 // NANOS_IN_MINUTE
+
+        market_open_locs = np.searchsorted(
+            self._market_open_values, minute_vals, side='right',
+        ) - 1
+        market_opens = self._market_open_values[market_open_locs]
+        market_closes = self._market_close_values[market_open_locs]
+
+        deltas = minute_vals - market_opens
+        if (deltas >= self._minutes_per_day).any():
+            raise ValueError("Given minute is not between an open and a close")
+        deltas = np.minimum(deltas, market_closes - market_opens)
+
+        return market_open_locs * self._minutes_per_day + deltas
+
     def load_raw_arrays(self, fields, start_dt, end_dt, sids):
         """
         Parameters
@@ -401,7 +401,11 @@ class PandasCSV(with_metaclass(ABCMeta, object)):
 
     def __iter__(self):
         asset_cache = {}
-        for dt, series in self.df.iterrows():
+        columns = self.df.columns
+        # itertuples avoids building a Series (and coercing every row to a
+        # common dtype) for each row of the frame.
+        for row in self.df.itertuples(index=True, name=None):
+            dt = row[0]
             if dt < self.start_date:
                 continue
 
@@ -413,7 +417,7 @@ class PandasCSV(with_metaclass(ABCMeta, object)):
             # the dt column is dropped. So, we need to manually copy
             # dt into the event.
             event.dt = dt
-            for k, v in series.iteritems():
+            for k, v in zip(columns, row[1:]):
                 # convert numpy integer types to
                 # int. This assumes we are on a 64bit
                 # platform that will not lose information